@@ -8,15 +8,26 @@ Usage:
     python dd_checklist.py
 """
 
+from __future__ import annotations
+
+import heapq
+import re
+import string
 import sys
+from collections import Counter
+from copy import copy
 from datetime import datetime
+from functools import lru_cache
+from io import BytesIO
+from operator import itemgetter
 from pathlib import Path
+from types import SimpleNamespace
+from typing import TYPE_CHECKING
 
-from openpyxl import Workbook
-from openpyxl.formatting.rule import CellIsRule
-from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
-from openpyxl.utils import get_column_letter
-from openpyxl.worksheet.datavalidation import DataValidation
+# openpyxl is imported where it is used: its import chain is the bulk of
+# the CLI start-up time, and the menus / preview do not need it.
+if TYPE_CHECKING:
+    from openpyxl import Workbook
 
 # ---------------------------------------------------------------------------
 # Constants
@@ -82,115 +93,146 @@ CORE_DOCUMENTS = [
 ]
 
 
-def _sector_documents():
-    """Return sector-specific documents dict keyed by sector name."""
-    return {
-        "Healthcare": [
-            ("Compliance", "Medical / healthcare operating licences", "Licenças de atividade médica / saúde", "Yes", "High"),
-            ("Compliance", "Patient data compliance (GDPR health data)", "Conformidade dados de pacientes (RGPD dados de saúde)", "Yes", "High"),
-            ("Operational", "Equipment certifications & calibration logs", "Certificações de equipamentos e registos de calibração", "Yes", "High"),
-            ("Compliance", "Clinical trial authorizations", "Autorizações de ensaios clínicos", "No", "Medium"),
-            ("Compliance", "Pharmacy / drug distribution licences", "Licenças de farmácia / distribuição de medicamentos", "No", "High"),
-            ("HR", "Medical staff credentials & licences", "Credenciais e cédulas profissionais do pessoal médico", "Yes", "High"),
-            ("Operational", "Health & safety inspection reports", "Relatórios de inspeção de saúde e segurança", "Yes", "Medium"),
-            ("Compliance", "Agreements with national health service", "Acordos com o Serviço Nacional de Saúde", "No", "Medium"),
-        ],
-        "Technology": [
-            ("IP", "IP portfolio (patents, trademarks, domains)", "Portfólio de PI (patentes, marcas, domínios)", "Yes", "High"),
-            ("IP", "Software licence agreements (inbound)", "Contratos de licença de software (inbound)", "Yes", "High"),
-            ("IP", "Software licence agreements (outbound / SaaS)", "Contratos de licença de software (outbound / SaaS)", "Yes", "High"),
-            ("IP", "Source code escrow agreements", "Contratos de escrow de código-fonte", "No", "Medium"),
-            ("IP", "Open source software audit", "Auditoria de software open source", "Yes", "High"),
-            ("Commercial", "SaaS / subscription metrics (ARR, churn, LTV)", "Métricas SaaS / subscrição (ARR, churn, LTV)", "Yes", "High"),
-            ("Operational", "IT infrastructure & security audit", "Auditoria de infraestrutura TI e segurança", "Yes", "High"),
-            ("Compliance", "Data breach history & incident response plan", "Histórico de violações de dados e plano de resposta", "Yes", "Medium"),
-            ("HR", "Key developer / tech talent retention plans", "Planos de retenção de talento tecnológico-chave", "No", "Medium"),
-            ("Commercial", "Customer contracts with SLA details", "Contratos de clientes com detalhe de SLA", "Yes", "Medium"),
-        ],
-        "Industrial": [
-            ("Compliance", "Environmental permits & impact assessments", "Licenças ambientais e avaliações de impacto", "Yes", "High"),
-            ("Compliance", "Health & Safety certifications (ISO 45001)", "Certificações de Saúde e Segurança (ISO 45001)", "Yes", "High"),
-            ("Operational", "Equipment maintenance logs", "Registos de manutenção de equipamentos", "Yes", "Medium"),
-            ("Operational", "Production capacity reports", "Relatórios de capacidade produtiva", "Yes", "Medium"),
-            ("Compliance", "Environmental remediation obligations", "Obrigações de remediação ambiental", "Yes", "High"),
-            ("Operational", "Supply chain / logistics contracts", "Contratos de cadeia de abastecimento / logística", "Yes", "Medium"),
-            ("Compliance", "Quality management certifications (ISO 9001)", "Certificações de gestão de qualidade (ISO 9001)", "Yes", "Medium"),
-            ("Operational", "Fixed asset register with valuations", "Registo de ativos fixos com avaliações", "Yes", "High"),
-        ],
-        "Real Estate": [
-            ("Legal", "Property title deeds / Certidões prediais", "Escrituras de propriedade / Certidões prediais", "Yes", "High"),
-            ("Legal", "Land registry certificates", "Certidões do registo predial", "Yes", "High"),
-            ("Commercial", "Lease agreements (tenant schedule)", "Contratos de arrendamento (mapa de inquilinos)", "Yes", "High"),
-            ("Legal", "Building permits & occupancy licences", "Licenças de construção e utilização", "Yes", "High"),
-            ("Financial", "Independent property valuations", "Avaliações independentes de imóveis", "Yes", "High"),
-            ("Compliance", "Environmental site assessments", "Avaliações ambientais dos imóveis", "Yes", "Medium"),
-            ("Operational", "Property management contracts", "Contratos de gestão de propriedades", "Yes", "Medium"),
-            ("Financial", "Rental income schedule & vacancy rates", "Mapa de rendas e taxas de desocupação", "Yes", "High"),
-            ("Legal", "Easements, encumbrances & restrictions", "Servidões, ónus e restrições", "Yes", "High"),
-        ],
-        "Financial Services": [
-            ("Compliance", "Regulatory licences (Central Bank / CMVM / ASF)", "Licenças regulatórias (Banco de Portugal / CMVM / ASF)", "Yes", "High"),
-            ("Compliance", "Capital adequacy / solvency reports", "Relatórios de adequação de capital / solvência", "Yes", "High"),
-            ("Compliance", "AML / KYC policies & procedures", "Políticas e procedimentos AML / KYC", "Yes", "High"),
-            ("Compliance", "Regulatory inspection reports", "Relatórios de inspeções regulatórias", "Yes", "High"),
-            ("Financial", "Loan / credit portfolio analysis", "Análise da carteira de crédito", "Yes", "High"),
-            ("Financial", "Provision / impairment schedules", "Mapas de provisões / imparidades", "Yes", "High"),
-            ("Compliance", "Compliance officer reports (2 years)", "Relatórios do compliance officer (2 anos)", "Yes", "Medium"),
-            ("Operational", "IT systems & cybersecurity audit", "Auditoria de sistemas TI e cibersegurança", "Yes", "High"),
-            ("Compliance", "Client complaints register", "Registo de reclamações de clientes", "No", "Medium"),
-        ],
-        "Retail": [
-            ("Commercial", "Franchise / distribution agreements", "Contratos de franquia / distribuição", "Yes", "High"),
-            ("Commercial", "E-commerce platform details & metrics", "Detalhes e métricas da plataforma e-commerce", "No", "Medium"),
-            ("Legal", "Store lease agreements", "Contratos de arrendamento de lojas", "Yes", "High"),
-            ("IP", "Brand / trademark registrations", "Registos de marca", "Yes", "High"),
-            ("Operational", "Inventory management reports", "Relatórios de gestão de inventário", "Yes", "Medium"),
-            ("Commercial", "Loyalty programme details", "Detalhes do programa de fidelização", "No", "Low"),
-            ("Compliance", "Consumer protection compliance", "Conformidade com proteção do consumidor", "Yes", "Medium"),
-            ("Operational", "Store network profitability analysis", "Análise de rentabilidade da rede de lojas", "Yes", "High"),
-        ],
-    }
+# Sector-specific documents keyed by sector name
+_SECTOR_DOCUMENTS = {
+    "Healthcare": [
+        ("Compliance", "Medical / healthcare operating licences", "Licenças de atividade médica / saúde", "Yes", "High"),
+        ("Compliance", "Patient data compliance (GDPR health data)", "Conformidade dados de pacientes (RGPD dados de saúde)", "Yes", "High"),
+        ("Operational", "Equipment certifications & calibration logs", "Certificações de equipamentos e registos de calibração", "Yes", "High"),
+        ("Compliance", "Clinical trial authorizations", "Autorizações de ensaios clínicos", "No", "Medium"),
+        ("Compliance", "Pharmacy / drug distribution licences", "Licenças de farmácia / distribuição de medicamentos", "No", "High"),
+        ("HR", "Medical staff credentials & licences", "Credenciais e cédulas profissionais do pessoal médico", "Yes", "High"),
+        ("Operational", "Health & safety inspection reports", "Relatórios de inspeção de saúde e segurança", "Yes", "Medium"),
+        ("Compliance", "Agreements with national health service", "Acordos com o Serviço Nacional de Saúde", "No", "Medium"),
+    ],
+    "Technology": [
+        ("IP", "IP portfolio (patents, trademarks, domains)", "Portfólio de PI (patentes, marcas, domínios)", "Yes", "High"),
+        ("IP", "Software licence agreements (inbound)", "Contratos de licença de software (inbound)", "Yes", "High"),
+        ("IP", "Software licence agreements (outbound / SaaS)", "Contratos de licença de software (outbound / SaaS)", "Yes", "High"),
+        ("IP", "Source code escrow agreements", "Contratos de escrow de código-fonte", "No", "Medium"),
+        ("IP", "Open source software audit", "Auditoria de software open source", "Yes", "High"),
+        ("Commercial", "SaaS / subscription metrics (ARR, churn, LTV)", "Métricas SaaS / subscrição (ARR, churn, LTV)", "Yes", "High"),
+        ("Operational", "IT infrastructure & security audit", "Auditoria de infraestrutura TI e segurança", "Yes", "High"),
+        ("Compliance", "Data breach history & incident response plan", "Histórico de violações de dados e plano de resposta", "Yes", "Medium"),
+        ("HR", "Key developer / tech talent retention plans", "Planos de retenção de talento tecnológico-chave", "No", "Medium"),
+        ("Commercial", "Customer contracts with SLA details", "Contratos de clientes com detalhe de SLA", "Yes", "Medium"),
+    ],
+    "Industrial": [
+        ("Compliance", "Environmental permits & impact assessments", "Licenças ambientais e avaliações de impacto", "Yes", "High"),
+        ("Compliance", "Health & Safety certifications (ISO 45001)", "Certificações de Saúde e Segurança (ISO 45001)", "Yes", "High"),
+        ("Operational", "Equipment maintenance logs", "Registos de manutenção de equipamentos", "Yes", "Medium"),
+        ("Operational", "Production capacity reports", "Relatórios de capacidade produtiva", "Yes", "Medium"),
+        ("Compliance", "Environmental remediation obligations", "Obrigações de remediação ambiental", "Yes", "High"),
+        ("Operational", "Supply chain / logistics contracts", "Contratos de cadeia de abastecimento / logística", "Yes", "Medium"),
+        ("Compliance", "Quality management certifications (ISO 9001)", "Certificações de gestão de qualidade (ISO 9001)", "Yes", "Medium"),
+        ("Operational", "Fixed asset register with valuations", "Registo de ativos fixos com avaliações", "Yes", "High"),
+    ],
+    "Real Estate": [
+        ("Legal", "Property title deeds / Certidões prediais", "Escrituras de propriedade / Certidões prediais", "Yes", "High"),
+        ("Legal", "Land registry certificates", "Certidões do registo predial", "Yes", "High"),
+        ("Commercial", "Lease agreements (tenant schedule)", "Contratos de arrendamento (mapa de inquilinos)", "Yes", "High"),
+        ("Legal", "Building permits & occupancy licences", "Licenças de construção e utilização", "Yes", "High"),
+        ("Financial", "Independent property valuations", "Avaliações independentes de imóveis", "Yes", "High"),
+        ("Compliance", "Environmental site assessments", "Avaliações ambientais dos imóveis", "Yes", "Medium"),
+        ("Operational", "Property management contracts", "Contratos de gestão de propriedades", "Yes", "Medium"),
+        ("Financial", "Rental income schedule & vacancy rates", "Mapa de rendas e taxas de desocupação", "Yes", "High"),
+        ("Legal", "Easements, encumbrances & restrictions", "Servidões, ónus e restrições", "Yes", "High"),
+    ],
+    "Financial Services": [
+        ("Compliance", "Regulatory licences (Central Bank / CMVM / ASF)", "Licenças regulatórias (Banco de Portugal / CMVM / ASF)", "Yes", "High"),
+        ("Compliance", "Capital adequacy / solvency reports", "Relatórios de adequação de capital / solvência", "Yes", "High"),
+        ("Compliance", "AML / KYC policies & procedures", "Políticas e procedimentos AML / KYC", "Yes", "High"),
+        ("Compliance", "Regulatory inspection reports", "Relatórios de inspeções regulatórias", "Yes", "High"),
+        ("Financial", "Loan / credit portfolio analysis", "Análise da carteira de crédito", "Yes", "High"),
+        ("Financial", "Provision / impairment schedules", "Mapas de provisões / imparidades", "Yes", "High"),
+        ("Compliance", "Compliance officer reports (2 years)", "Relatórios do compliance officer (2 anos)", "Yes", "Medium"),
+        ("Operational", "IT systems & cybersecurity audit", "Auditoria de sistemas TI e cibersegurança", "Yes", "High"),
+        ("Compliance", "Client complaints register", "Registo de reclamações de clientes", "No", "Medium"),
+    ],
+    "Retail": [
+        ("Commercial", "Franchise / distribution agreements", "Contratos de franquia / distribuição", "Yes", "High"),
+        ("Commercial", "E-commerce platform details & metrics", "Detalhes e métricas da plataforma e-commerce", "No", "Medium"),
+        ("Legal", "Store lease agreements", "Contratos de arrendamento de lojas", "Yes", "High"),
+        ("IP", "Brand / trademark registrations", "Registos de marca", "Yes", "High"),
+        ("Operational", "Inventory management reports", "Relatórios de gestão de inventário", "Yes", "Medium"),
+        ("Commercial", "Loyalty programme details", "Detalhes do programa de fidelização", "No", "Low"),
+        ("Compliance", "Consumer protection compliance", "Conformidade com proteção do consumidor", "Yes", "Medium"),
+        ("Operational", "Store network profitability analysis", "Análise de rentabilidade da rede de lojas", "Yes", "High"),
+    ],
+}
+
+
+# Deal-type-specific documents keyed by deal type
+_DEAL_DOCUMENTS = {
+    "Asset Deal": [
+        ("Legal", "Detailed asset list with descriptions", "Lista detalhada de ativos com descrições", "Yes", "High"),
+        ("Legal", "Asset transfer agreements (drafts)", "Contratos de transferência de ativos (minutas)", "Yes", "High"),
+        ("Legal", "Third-party consents for asset transfer", "Consentimentos de terceiros para transferência de ativos", "Yes", "High"),
+        ("Tax", "Tax implications analysis of asset transfer", "Análise de implicações fiscais da transferência de ativos", "Yes", "High"),
+        ("Financial", "Asset valuations / appraisals", "Avaliações de ativos", "Yes", "High"),
+        ("Legal", "Assumed vs excluded liabilities schedule", "Mapa de passivos assumidos vs excluídos", "Yes", "High"),
+    ],
+    "Share Deal": [
+        ("Legal", "Shareholder agreements", "Acordos parassociais", "Yes", "High"),
+        ("Legal", "Share certificates", "Títulos de participação / certificados de ações", "Yes", "High"),
+        ("Legal", "Capitalisation table (Cap table)", "Tabela de capitalização (Cap table)", "Yes", "High"),
+        ("Legal", "Share transfer restrictions / pre-emption rights", "Restrições de transmissão de ações / direitos de preferência", "Yes", "High"),
+        ("Legal", "Drag-along / tag-along provisions", "Cláusulas de drag-along / tag-along", "Yes", "Medium"),
+        ("Legal", "Minority shareholder rights", "Direitos de acionistas minoritários", "Yes", "Medium"),
+        ("Financial", "Dividend history & policy", "Histórico e política de dividendos", "Yes", "Medium"),
+        ("Legal", "Stock option / warrant agreements", "Contratos de stock options / warrants", "No", "Medium"),
+    ],
+    "Merger": [
+        ("Legal", "Merger plan / projeto de fusão", "Projeto de fusão", "Yes", "High"),
+        ("Financial", "Fairness opinion", "Fairness opinion", "Yes", "High"),
+        ("Legal", "Exchange ratio justification", "Fundamentação da relação de troca", "Yes", "High"),
+        ("Legal", "Merger filing / regulatory notifications", "Notificações regulatórias da fusão", "Yes", "High"),
+        ("Compliance", "Competition / antitrust analysis", "Análise concorrencial / antitrust", "Yes", "High"),
+        ("Legal", "Creditor notification process documentation", "Documentação do processo de notificação de credores", "Yes", "High"),
+        ("HR", "Integration plan (key personnel)", "Plano de integração (pessoal-chave)", "Yes", "Medium"),
+        ("Financial", "Synergies analysis", "Análise de sinergias", "Yes", "Medium"),
+    ],
+}
+
+
+# Per-language views of the tables above, pre-sorted by category then priority:
+# (category, name, required, priority, priority_rank)
 
+_PRIORITY_RANK = {"High": 0, "Medium": 1, "Low": 2}
+_SORT_KEY = itemgetter(0, 4)
 
-def _deal_documents():
-    """Return deal-type-specific documents dict keyed by deal type."""
+
+def _by_language(rows) -> dict[str, list[tuple]]:
+    """Split bilingual document rows into one sorted list per language."""
     return {
-        "Asset Deal": [
-            ("Legal", "Detailed asset list with descriptions", "Lista detalhada de ativos com descrições", "Yes", "High"),
-            ("Legal", "Asset transfer agreements (drafts)", "Contratos de transferência de ativos (minutas)", "Yes", "High"),
-            ("Legal", "Third-party consents for asset transfer", "Consentimentos de terceiros para transferência de ativos", "Yes", "High"),
-            ("Tax", "Tax implications analysis of asset transfer", "Análise de implicações fiscais da transferência de ativos", "Yes", "High"),
-            ("Financial", "Asset valuations / appraisals", "Avaliações de ativos", "Yes", "High"),
-            ("Legal", "Assumed vs excluded liabilities schedule", "Mapa de passivos assumidos vs excluídos", "Yes", "High"),
-        ],
-        "Share Deal": [
-            ("Legal", "Shareholder agreements", "Acordos parassociais", "Yes", "High"),
-            ("Legal", "Share certificates", "Títulos de participação / certificados de ações", "Yes", "High"),
-            ("Legal", "Capitalisation table (Cap table)", "Tabela de capitalização (Cap table)", "Yes", "High"),
-            ("Legal", "Share transfer restrictions / pre-emption rights", "Restrições de transmissão de ações / direitos de preferência", "Yes", "High"),
-            ("Legal", "Drag-along / tag-along provisions", "Cláusulas de drag-along / tag-along", "Yes", "Medium"),
-            ("Legal", "Minority shareholder rights", "Direitos de acionistas minoritários", "Yes", "Medium"),
-            ("Financial", "Dividend history & policy", "Histórico e política de dividendos", "Yes", "Medium"),
-            ("Legal", "Stock option / warrant agreements", "Contratos de stock options / warrants", "No", "Medium"),
-        ],
-        "Merger": [
-            ("Legal", "Merger plan / projeto de fusão", "Projeto de fusão", "Yes", "High"),
-            ("Financial", "Fairness opinion", "Fairness opinion", "Yes", "High"),
-            ("Legal", "Exchange ratio justification", "Fundamentação da relação de troca", "Yes", "High"),
-            ("Legal", "Merger filing / regulatory notifications", "Notificações regulatórias da fusão", "Yes", "High"),
-            ("Compliance", "Competition / antitrust analysis", "Análise concorrencial / antitrust", "Yes", "High"),
-            ("Legal", "Creditor notification process documentation", "Documentação do processo de notificação de credores", "Yes", "High"),
-            ("HR", "Integration plan (key personnel)", "Plano de integração (pessoal-chave)", "Yes", "Medium"),
-            ("Financial", "Synergies analysis", "Análise de sinergias", "Yes", "Medium"),
-        ],
+        "EN": sorted(
+            ((cat, name_en, req, prio, _PRIORITY_RANK.get(prio, 9))
+             for cat, name_en, _, req, prio in rows),
+            key=_SORT_KEY,
+        ),
+        "PT": sorted(
+            ((cat, name_pt, req, prio, _PRIORITY_RANK.get(prio, 9))
+             for cat, _, name_pt, req, prio in rows),
+            key=_SORT_KEY,
+        ),
     }
 
 
+def _transpose(tables: dict[str, dict[str, list[tuple]]]) -> dict[str, dict[str, list[tuple]]]:
+    """Turn {key: {lang: rows}} into {lang: {key: rows}}."""
+    return {lang: {key: split[lang] for key, split in tables.items()} for lang in ("EN", "PT")}
+
+
+CORE_DOCS = _by_language(CORE_DOCUMENTS)
+_SECTOR_DOCS = _transpose({sector: _by_language(rows) for sector, rows in _SECTOR_DOCUMENTS.items()})
+_DEAL_DOCS = _transpose({deal: _by_language(rows) for deal, rows in _DEAL_DOCUMENTS.items()})
+
+
 # ---------------------------------------------------------------------------
 # Labels — bilingual
 # ---------------------------------------------------------------------------
 
-LABELS = {
+_LABELS_RAW = {
     "EN": {
         "checklist_tab": "Checklist",
         "summary_tab": "Summary",
@@ -302,150 +344,268 @@ LABELS = {
 }
 
 
+def _intern_strings(value):
+    """Return ``value`` with every (nested) string passed through sys.intern."""
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, list):
+        return [_intern_strings(v) for v in value]
+    if isinstance(value, tuple):
+        return tuple(_intern_strings(v) for v in value)
+    return value
+
+
+# Attribute access (labels.headers) for the tab builders and terminal UI.
+# The strings are written on every run, so they are interned once here.
+LABELS = {
+    lang: SimpleNamespace(**{key: _intern_strings(value) for key, value in raw.items()})
+    for lang, raw in _LABELS_RAW.items()
+}
+
+
 # ---------------------------------------------------------------------------
 # Build the full document list
 # ---------------------------------------------------------------------------
 
-def build_document_list(deal_type: str, sector: str, lang: str) -> list[tuple]:
-    """Return list of (category, name, required, priority) tuples."""
-    name_idx = 1 if lang == "EN" else 2
-    docs: list[tuple] = []
+def _make_builder(lang: str):
+    """Return a document list builder specialised for one language."""
+    core = CORE_DOCS[lang]
+    sector_docs = _SECTOR_DOCS[lang]
+    deal_docs = _DEAL_DOCS[lang]
+
+    def build(deal_type: str, sector: str) -> tuple[tuple, ...]:
+        # The tables are already sorted by category then priority rank;
+        # merge them and drop the rank field.
+        merged = heapq.merge(
+            core, sector_docs.get(sector, ()), deal_docs.get(deal_type, ()), key=_SORT_KEY,
+        )
+        return tuple(doc[:4] for doc in merged)
+
+    build.__name__ = build.__qualname__ = f"_build_{lang.lower()}"
+    return build
+
 
-    for doc in CORE_DOCUMENTS:
-        docs.append((doc[0], doc[name_idx], doc[3], doc[4]))
+_BUILDERS = {lang: _make_builder(lang) for lang in ("EN", "PT")}
 
-    sector_docs = _sector_documents().get(sector, [])
-    for doc in sector_docs:
-        docs.append((doc[0], doc[name_idx], doc[3], doc[4]))
 
-    deal_docs = _deal_documents().get(deal_type, [])
-    for doc in deal_docs:
-        docs.append((doc[0], doc[name_idx], doc[3], doc[4]))
+@lru_cache(maxsize=128)
+def build_document_list(deal_type: str, sector: str, lang: str) -> tuple[tuple, ...]:
+    """Return the (category, name, required, priority) tuples for a deal.
 
-    # Sort by category then priority rank
-    priority_order = {"High": 0, "Medium": 1, "Low": 2}
-    docs.sort(key=lambda d: (d[0], priority_order.get(d[3], 9)))
-    return docs
+    Results are cached per arguments, so a tuple is returned; callers that
+    add custom documents take a ``list()`` copy first.
+    """
+    if lang not in _BUILDERS:
+        raise ValueError(f"Invalid language: {lang}. Must be EN or PT")
+    return _BUILDERS[lang](deal_type, sector)
 
 
 # ---------------------------------------------------------------------------
 # Excel formatting helpers
 # ---------------------------------------------------------------------------
 
-DARK_BLUE = PatternFill(start_color="1F3864", end_color="1F3864", fill_type="solid")
-WHITE_FONT = Font(name="Calibri", bold=True, color="FFFFFF", size=11)
-HEADER_FONT = Font(name="Calibri", bold=True, color="FFFFFF", size=11)
-TITLE_FONT = Font(name="Calibri", bold=True, size=14)
-SUBTITLE_FONT = Font(name="Calibri", bold=True, size=12)
-BODY_FONT = Font(name="Calibri", size=11)
-BOLD_FONT = Font(name="Calibri", bold=True, size=11)
-THIN_BORDER = Border(
-    left=Side(style="thin"), right=Side(style="thin"),
-    top=Side(style="thin"), bottom=Side(style="thin"),
-)
-FILL_HIGH = PatternFill(start_color="F4CCCC", end_color="F4CCCC", fill_type="solid")
-FILL_MEDIUM = PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid")
-FILL_LOW = PatternFill(start_color="D9EAD3", end_color="D9EAD3", fill_type="solid")
-
-STATUS_FILLS = {
-    "Pending": PatternFill(start_color="FCE4D6", end_color="FCE4D6", fill_type="solid"),
-    "Received": PatternFill(start_color="DDEBF7", end_color="DDEBF7", fill_type="solid"),
-    "Reviewed": PatternFill(start_color="E2EFDA", end_color="E2EFDA", fill_type="solid"),
-    "Missing": PatternFill(start_color="F4CCCC", end_color="F4CCCC", fill_type="solid"),
-    # PT equivalents
-    "Pendente": PatternFill(start_color="FCE4D6", end_color="FCE4D6", fill_type="solid"),
-    "Recebido": PatternFill(start_color="DDEBF7", end_color="DDEBF7", fill_type="solid"),
-    "Revisto": PatternFill(start_color="E2EFDA", end_color="E2EFDA", fill_type="solid"),
-    "Em falta": PatternFill(start_color="F4CCCC", end_color="F4CCCC", fill_type="solid"),
-}
+@lru_cache(maxsize=1)
+def _styles() -> SimpleNamespace:
+    """Build the shared Font / Fill / Border / Alignment objects on first use.
+
+    Importing the module (e.g. just to call build_document_list) neither
+    imports openpyxl nor allocates any style objects.
+    """
+    from openpyxl.styles import Alignment, Border, Font, PatternFill, Side
+
+    fill_high = PatternFill(start_color="F4CCCC", end_color="F4CCCC", fill_type="solid")
+    fill_medium = PatternFill(start_color="FFF2CC", end_color="FFF2CC", fill_type="solid")
+    fill_low = PatternFill(start_color="D9EAD3", end_color="D9EAD3", fill_type="solid")
+    return SimpleNamespace(
+        DARK_BLUE=PatternFill(start_color="1F3864", end_color="1F3864", fill_type="solid"),
+        WHITE_FONT=Font(name="Calibri", bold=True, color="FFFFFF", size=11),
+        HEADER_FONT=Font(name="Calibri", bold=True, color="FFFFFF", size=11),
+        TITLE_FONT=Font(name="Calibri", bold=True, size=14),
+        SUBTITLE_FONT=Font(name="Calibri", bold=True, size=12),
+        BODY_FONT=Font(name="Calibri", size=11),
+        BOLD_FONT=Font(name="Calibri", bold=True, size=11),
+        THIN_BORDER=Border(
+            left=Side(style="thin"), right=Side(style="thin"),
+            top=Side(style="thin"), bottom=Side(style="thin"),
+        ),
+        ALIGN_HEADER=Alignment(horizontal="center", vertical="center"),
+        ALIGN_CENTER=Alignment(vertical="center"),
+        ALIGN_CENTER_WRAP=Alignment(vertical="center", wrap_text=True),
+        FILL_HIGH=fill_high,
+        FILL_MEDIUM=fill_medium,
+        FILL_LOW=fill_low,
+        STATUS_FILLS={
+            "Pending": PatternFill(start_color="FCE4D6", end_color="FCE4D6", fill_type="solid"),
+            "Received": PatternFill(start_color="DDEBF7", end_color="DDEBF7", fill_type="solid"),
+            "Reviewed": PatternFill(start_color="E2EFDA", end_color="E2EFDA", fill_type="solid"),
+            "Missing": PatternFill(start_color="F4CCCC", end_color="F4CCCC", fill_type="solid"),
+            # PT equivalents
+            "Pendente": PatternFill(start_color="FCE4D6", end_color="FCE4D6", fill_type="solid"),
+            "Recebido": PatternFill(start_color="DDEBF7", end_color="DDEBF7", fill_type="solid"),
+            "Revisto": PatternFill(start_color="E2EFDA", end_color="E2EFDA", fill_type="solid"),
+            "Em falta": PatternFill(start_color="F4CCCC", end_color="F4CCCC", fill_type="solid"),
+        },
+        PRIORITY_FILLS={"High": fill_high, "Medium": fill_medium, "Low": fill_low},
+    )
+
+
+# Letters of columns 1-32 ("A" .. "AF")
+_COL_LETTERS = tuple(string.ascii_uppercase) + tuple("A" + c for c in string.ascii_uppercase[:6])
+
+PRIORITY_FORMULA = '"High,Medium,Low"'
+
+
+@lru_cache(maxsize=4)
+def _status_formula(lang: str) -> str:
+    """Return the Status dropdown list formula for a language.
+
+    Only the formula is shared: a DataValidation keeps the ranges it is
+    applied to, so each sheet still gets its own instance.
+    """
+    return '"' + ",".join(LABELS[lang].statuses) + '"'
+
+
+def _set_widths(ws, columns_data, headers, min_width=12, max_width=55, explicit=None):
+    """Set column widths from the header strings and the source rows.
+
+    Runs over the plain Python data before any cell is written, which is
+    also what write-only worksheets require. Columns beyond the width of
+    ``columns_data`` are sized from their header alone; columns given in
+    ``explicit`` (letter -> width) take that width and are not measured.
+    """
+    explicit = explicit or {}
+    cd = ws.column_dimensions
+    for i, header in enumerate(headers):
+        letter = _COL_LETTERS[i]
+        if letter in explicit:
+            continue
+        values = [len(str(row[i])) + 3 for row in columns_data if i < len(row)]
+        cd[letter].width = min(max_width, max(min_width, len(str(header)) + 3, *values))
+    for letter, width in explicit.items():
+        cd[letter].width = width
+
+
+def _cell(ws, value=None, font=None, fill=None, border=None, alignment=None):
+    """Return a write-only cell with the given shared style objects applied."""
+    from openpyxl.cell import WriteOnlyCell
+
+    cell = WriteOnlyCell(ws, value=value)
+    if font is not None:
+        cell.font = font
+    if fill is not None:
+        cell.fill = fill
+    if border is not None:
+        cell.border = border
+    if alignment is not None:
+        cell.alignment = alignment
+    return cell
 
-PRIORITY_FILLS = {"High": FILL_HIGH, "Medium": FILL_MEDIUM, "Low": FILL_LOW}
 
+def _cell_factory(ws):
+    """Return a ``_cell``-like constructor for ``ws`` that resolves each style combination once."""
+    from openpyxl.cell import WriteOnlyCell
 
-def _auto_width(ws, min_width=12, max_width=55):
-    """Auto-adjust column widths based on cell content."""
-    for col_cells in ws.columns:
-        col_letter = get_column_letter(col_cells[0].column)
-        best = min_width
-        for cell in col_cells:
-            if cell.value:
-                best = max(best, min(len(str(cell.value)) + 3, max_width))
-        ws.column_dimensions[col_letter].width = best
+    # Keyed by identity: the arguments are the shared _styles() objects
+    resolved = {}
+
+    def make(value=None, font=None, fill=None, border=None, alignment=None):
+        key = (id(font), id(fill), id(border), id(alignment))
+        if key not in resolved:
+            template = _cell(ws, font=font, fill=fill, border=border, alignment=alignment)
+            resolved[key] = template._style
+        cell = WriteOnlyCell(ws, value=value)
+        cell._style = copy(resolved[key])
+        return cell
+
+    return make
+
+
+def _header_cell(make, value, alignment=None):
+    """Return a header cell (white bold text on dark blue, thin border) via ``make``."""
+    st = _styles()
+    return make(
+        value, font=st.HEADER_FONT, fill=st.DARK_BLUE, border=st.THIN_BORDER, alignment=alignment,
+    )
+
+
+def _append_checklist_rows(ws, make, docs: list[tuple], default_status: str):
+    """Append one body row per document to the checklist sheet."""
+    st = _styles()
+    font, border = st.BODY_FONT, st.THIN_BORDER
+    center, wrap = st.ALIGN_CENTER, st.ALIGN_CENTER_WRAP
+    prio_fills = st.PRIORITY_FILLS
+
+    append = ws.append
+    for cat, name, req, prio in docs:
+        append([
+            make(cat, font=font, border=border, alignment=center),
+            make(name, font=font, border=border, alignment=wrap),
+            make(req, font=font, border=border, alignment=center),
+            # Priority fill; custom documents may use other priorities
+            make(prio, font=font, fill=prio_fills.get(prio), border=border, alignment=center),
+            make("", font=font, border=border, alignment=center),
+            make(default_status, font=font, border=border, alignment=center),
+            make("", font=font, border=border, alignment=center),
+            make("", font=font, border=border, alignment=center),
+        ])
 
 
 # ---------------------------------------------------------------------------
 # Tab 1 — Checklist
 # ---------------------------------------------------------------------------
 
-def create_checklist_tab(wb: Workbook, docs: list[tuple], lang: str, labels: dict):
-    ws = wb.active
-    ws.title = labels["checklist_tab"]
+def create_checklist_tab(wb: Workbook, docs: list[tuple], lang: str, labels: SimpleNamespace):
+    from openpyxl.formatting.rule import CellIsRule
+    from openpyxl.worksheet.datavalidation import DataValidation
+
+    st = _styles()
+    ws = wb.create_sheet(title=labels.checklist_tab)
+
+    headers = labels.headers
+    statuses = labels.statuses
+
+    # Column widths and panes must be set before the first row is streamed
+    # Force document name column wider
+    _set_widths(ws, docs, headers, explicit={"B": 55})
+    # Column-level wrap covers rows users add later (written cells carry
+    # their own style, which wins)
+    ws.column_dimensions["B"].alignment = st.ALIGN_CENTER_WRAP
+    ws.freeze_panes = "A2"
 
-    headers = labels["headers"]
-    statuses = labels["statuses"]
+    cell = _cell_factory(ws)
 
     # Write headers
-    for col_idx, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col_idx, value=header)
-        cell.fill = DARK_BLUE
-        cell.font = HEADER_FONT
-        cell.alignment = Alignment(horizontal="center", vertical="center")
-        cell.border = THIN_BORDER
+    ws.append([_header_cell(cell, header, st.ALIGN_HEADER) for header in headers])
 
     # Write document rows
     default_status = statuses[0]  # Pending / Pendente
-    for row_idx, (cat, name, req, prio) in enumerate(docs, 2):
-        values = [cat, name, req, prio, "", default_status, "", ""]
-        for col_idx, val in enumerate(values, 1):
-            cell = ws.cell(row=row_idx, column=col_idx, value=val)
-            cell.font = BODY_FONT
-            cell.border = THIN_BORDER
-            cell.alignment = Alignment(vertical="center", wrap_text=(col_idx == 2))
-
-        # Priority fill (column 4)
-        prio_cell = ws.cell(row=row_idx, column=4)
-        if prio in PRIORITY_FILLS:
-            prio_cell.fill = PRIORITY_FILLS[prio]
-
-        # Status fill (column 6)
-        status_cell = ws.cell(row=row_idx, column=6)
-        if default_status in STATUS_FILLS:
-            status_cell.fill = STATUS_FILLS[default_status]
-
-    # Conditional formatting for Status column (F)
+    _append_checklist_rows(ws, cell, docs, default_status)
+
+    # Conditional formatting for Status column (F) — also colours the
+    # default status, so no static fill is written on the cells
     last_row = len(docs) + 1
     status_range = f"F2:F{last_row}"
-    for status_val, fill in STATUS_FILLS.items():
+    for status_val in statuses:
+        fill = st.STATUS_FILLS[status_val]
         ws.conditional_formatting.add(
             status_range,
             CellIsRule(operator="equal", formula=[f'"{status_val}"'], fill=fill),
         )
 
     # Data validation for Status column
-    dv_status = DataValidation(
-        type="list",
-        formula1='"' + ",".join(statuses) + '"',
-        allow_blank=True,
-    )
+    dv_status = DataValidation(type="list", formula1=_status_formula(lang), allow_blank=True)
     dv_status.error = "Please select a valid status."
     dv_status.errorTitle = "Invalid Status"
-    ws.add_data_validation(dv_status)
+    ws.data_validations.append(dv_status)
     dv_status.add(f"F2:F{last_row}")
 
     # Data validation for Priority column
-    dv_prio = DataValidation(
-        type="list", formula1='"High,Medium,Low"', allow_blank=True,
-    )
-    ws.add_data_validation(dv_prio)
+    dv_prio = DataValidation(type="list", formula1=PRIORITY_FORMULA, allow_blank=True)
+    ws.data_validations.append(dv_prio)
     dv_prio.add(f"D2:D{last_row}")
 
-    # Auto-filter & freeze
+    # Auto-filter
     ws.auto_filter.ref = f"A1:H{last_row}"
-    ws.freeze_panes = "A2"
-
-    _auto_width(ws)
-    # Force document name column wider
-    ws.column_dimensions["B"].width = 55
 
 
 # ---------------------------------------------------------------------------
@@ -453,171 +613,158 @@ def create_checklist_tab(wb: Workbook, docs: list[tuple], lang: str, labels: dic
 # ---------------------------------------------------------------------------
 
 def create_summary_tab(
-    wb: Workbook, docs: list[tuple], labels: dict,
+    wb: Workbook, docs: list[tuple], labels: SimpleNamespace,
     target: str, deal_type: str, sector: str, jurisdiction: str,
 ):
-    ws = wb.create_sheet(title=labels["summary_tab"])
+    st = _styles()
+    # Bound once: these are read for every row below
+    body_font, bold_font, border = st.BODY_FONT, st.BOLD_FONT, st.THIN_BORDER
+    ws = wb.create_sheet(title=labels.summary_tab)
+
+    cat_counts = Counter(map(itemgetter(0), docs))
+    prio_counts = Counter(map(itemgetter(3), docs))
+
+    cat_rows = [(cat, cat_counts[cat]) for cat in CATEGORIES if cat_counts[cat] > 0]
+    prio_rows = [
+        (prio, prio_counts[prio]) for prio in ("High", "Medium", "Low")
+        if prio_counts[prio] > 0
+    ]
+
+    # Summary widths are fixed, so nothing needs measuring; C and D span
+    # the merged title
+    cd = ws.column_dimensions
+    cd["A"].width = 30
+    cd["B"].width = 18
+    cd["C"].width = cd["D"].width = 12
+    count_label = labels.count
+    append = ws.append
+    cell = _cell_factory(ws)
 
     # Title
-    ws.merge_cells("A1:D1")
-    title_cell = ws.cell(row=1, column=1, value=labels["summary_title"])
-    title_cell.font = TITLE_FONT
+    ws.merged_cells.add("A1:D1")
+    append([cell(labels.summary_title, font=st.TITLE_FONT)])
+    append([])
 
     # Metadata
     meta = [
-        (labels["target"], target),
-        (labels["transaction"], deal_type),
-        (labels["sector"], sector),
-        (labels["jurisdiction"], jurisdiction),
-        (labels["date_generated"], datetime.now().strftime("%Y-%m-%d %H:%M")),
-        (labels["total_docs"], len(docs)),
+        (labels.target, target),
+        (labels.transaction, deal_type),
+        (labels.sector, sector),
+        (labels.jurisdiction, jurisdiction),
+        (labels.date_generated, datetime.now().strftime("%Y-%m-%d %H:%M")),
+        (labels.total_docs, len(docs)),
     ]
-    for i, (label, value) in enumerate(meta, 3):
-        ws.cell(row=i, column=1, value=label).font = BOLD_FONT
-        ws.cell(row=i, column=2, value=value).font = BODY_FONT
+    for label, value in meta:
+        append([cell(label, font=bold_font), cell(value, font=body_font)])
 
     # Breakdown by category
-    row = len(meta) + 5
-    ws.cell(row=row, column=1, value=labels["by_category"]).font = SUBTITLE_FONT
-    row += 1
-    cat_header_lbl = ws.cell(row=row, column=1, value=labels["category"])
-    cat_header_cnt = ws.cell(row=row, column=2, value=labels["count"])
-    for c in (cat_header_lbl, cat_header_cnt):
-        c.font = HEADER_FONT
-        c.fill = DARK_BLUE
-        c.border = THIN_BORDER
-
-    cat_counts = {}
-    for d in docs:
-        cat_counts[d[0]] = cat_counts.get(d[0], 0) + 1
-
-    for cat in CATEGORIES:
-        count = cat_counts.get(cat, 0)
-        if count > 0:
-            row += 1
-            ws.cell(row=row, column=1, value=cat).font = BODY_FONT
-            ws.cell(row=row, column=1).border = THIN_BORDER
-            ws.cell(row=row, column=2, value=count).font = BODY_FONT
-            ws.cell(row=row, column=2).border = THIN_BORDER
+    append([])
+    append([])
+    append([cell(labels.by_category, font=st.SUBTITLE_FONT)])
+    append([_header_cell(cell, labels.category), _header_cell(cell, count_label)])
+    for cat, count in cat_rows:
+        append([
+            cell(cat, font=body_font, border=border),
+            cell(count, font=body_font, border=border),
+        ])
 
     # Breakdown by priority
-    row += 2
-    ws.cell(row=row, column=1, value=labels["by_priority"]).font = SUBTITLE_FONT
-    row += 1
-    prio_header_lbl = ws.cell(row=row, column=1, value=labels["priority"])
-    prio_header_cnt = ws.cell(row=row, column=2, value=labels["count"])
-    for c in (prio_header_lbl, prio_header_cnt):
-        c.font = HEADER_FONT
-        c.fill = DARK_BLUE
-        c.border = THIN_BORDER
-
-    prio_counts = {}
-    for d in docs:
-        prio_counts[d[3]] = prio_counts.get(d[3], 0) + 1
-
-    for prio in ("High", "Medium", "Low"):
-        count = prio_counts.get(prio, 0)
-        if count > 0:
-            row += 1
-            c1 = ws.cell(row=row, column=1, value=prio)
-            c1.font = BODY_FONT
-            c1.border = THIN_BORDER
-            if prio in PRIORITY_FILLS:
-                c1.fill = PRIORITY_FILLS[prio]
-            c2 = ws.cell(row=row, column=2, value=count)
-            c2.font = BODY_FONT
-            c2.border = THIN_BORDER
-
-    _auto_width(ws)
-    ws.column_dimensions["A"].width = 30
-    ws.column_dimensions["B"].width = 18
+    append([])
+    append([cell(labels.by_priority, font=st.SUBTITLE_FONT)])
+    append([_header_cell(cell, labels.priority), _header_cell(cell, count_label)])
+    for prio, count in prio_rows:
+        append([
+            cell(prio, font=body_font, fill=st.PRIORITY_FILLS.get(prio), border=border),
+            cell(count, font=body_font, border=border),
+        ])
 
 
 # ---------------------------------------------------------------------------
 # Tab 3 — Instructions
 # ---------------------------------------------------------------------------
 
-def create_instructions_tab(wb: Workbook, labels: dict):
-    ws = wb.create_sheet(title=labels["instructions_tab"])
+def create_instructions_tab(wb: Workbook, labels: SimpleNamespace):
+    st = _styles()
+    body_font, bold_font, border = st.BODY_FONT, st.BOLD_FONT, st.THIN_BORDER
+    ws = wb.create_sheet(title=labels.instructions_tab)
+    timeline = labels.timeline_items
+    contact_hdrs = labels.contacts_headers
+    roles = labels.contacts_roles
+
+    _set_widths(ws, (), contact_hdrs, explicit={"A": 28, "B": 60})
+    append = ws.append
+    cell = _cell_factory(ws)
 
-    row = 1
-    ws.merge_cells("A1:E1")
-    ws.cell(row=row, column=1, value=labels["instructions_title"]).font = TITLE_FONT
+    ws.merged_cells.add("A1:E1")
+    append([cell(labels.instructions_title, font=st.TITLE_FONT)])
 
     # How to use
-    row += 2
-    ws.cell(row=row, column=1, value=labels["how_to_use"]).font = SUBTITLE_FONT
-    for item in labels["how_to_use_items"]:
-        row += 1
-        ws.cell(row=row, column=1, value=item).font = BODY_FONT
+    append([])
+    append([cell(labels.how_to_use, font=st.SUBTITLE_FONT)])
+    for item in labels.how_to_use_items:
+        append([cell(item, font=body_font)])
 
     # Status definitions
-    row += 2
-    ws.cell(row=row, column=1, value=labels["status_definitions"]).font = SUBTITLE_FONT
-    row += 1
-    for c, hdr in [(1, "Status"), (2, "Definition" if "how_to_use" in labels else "Definição")]:
-        cell = ws.cell(row=row, column=c, value=hdr)
-        cell.font = HEADER_FONT
-        cell.fill = DARK_BLUE
-        cell.border = THIN_BORDER
-    for status, definition in labels["status_defs"]:
-        row += 1
-        c1 = ws.cell(row=row, column=1, value=status)
-        c1.font = BOLD_FONT
-        c1.border = THIN_BORDER
-        if status in STATUS_FILLS:
-            c1.fill = STATUS_FILLS[status]
-        c2 = ws.cell(row=row, column=2, value=definition)
-        c2.font = BODY_FONT
-        c2.border = THIN_BORDER
+    append([])
+    append([cell(labels.status_definitions, font=st.SUBTITLE_FONT)])
+    append([
+        _header_cell(cell, "Status"),
+        _header_cell(cell, "Definition" if hasattr(labels, "how_to_use") else "Definição"),
+    ])
+    for status, definition in labels.status_defs:
+        append([
+            cell(status, font=bold_font, fill=st.STATUS_FILLS.get(status), border=border),
+            cell(definition, font=body_font, border=border),
+        ])
 
     # Timeline
-    row += 2
-    ws.cell(row=row, column=1, value=labels["timeline_title"]).font = SUBTITLE_FONT
-    row += 1
-    for c, hdr in [(1, "Phase"), (2, "Activities")]:
-        cell = ws.cell(row=row, column=c, value=hdr)
-        cell.font = HEADER_FONT
-        cell.fill = DARK_BLUE
-        cell.border = THIN_BORDER
-    for phase, desc in labels["timeline_items"]:
-        row += 1
-        ws.cell(row=row, column=1, value=phase).font = BOLD_FONT
-        ws.cell(row=row, column=1).border = THIN_BORDER
-        ws.cell(row=row, column=2, value=desc).font = BODY_FONT
-        ws.cell(row=row, column=2).border = THIN_BORDER
+    append([])
+    append([cell(labels.timeline_title, font=st.SUBTITLE_FONT)])
+    append([_header_cell(cell, "Phase"), _header_cell(cell, "Activities")])
+    for phase, desc in timeline:
+        append([
+            cell(phase, font=bold_font, border=border),
+            cell(desc, font=body_font, border=border),
+        ])
 
     # Contacts template
-    row += 2
-    ws.cell(row=row, column=1, value=labels["contacts_title"]).font = SUBTITLE_FONT
-    row += 1
-    for c, hdr in enumerate(labels["contacts_headers"], 1):
-        cell = ws.cell(row=row, column=c, value=hdr)
-        cell.font = HEADER_FONT
-        cell.fill = DARK_BLUE
-        cell.border = THIN_BORDER
-    for role in labels["contacts_roles"]:
-        row += 1
-        ws.cell(row=row, column=1, value=role).font = BODY_FONT
-        for c in range(1, 6):
-            ws.cell(row=row, column=c).border = THIN_BORDER
-
-    _auto_width(ws)
-    ws.column_dimensions["A"].width = 28
-    ws.column_dimensions["B"].width = 60
+    append([])
+    append([cell(labels.contacts_title, font=st.SUBTITLE_FONT)])
+    append([_header_cell(cell, hdr) for hdr in contact_hdrs])
+    for role in roles:
+        # Firm / contact / email / phone are left blank for the user
+        append(
+            [cell(role, font=body_font, border=border)]
+            + [cell(border=border) for _ in range(4)]
+        )
 
 
 # ---------------------------------------------------------------------------
 # Terminal UI
 # ---------------------------------------------------------------------------
 
+def _read_line(prompt: str) -> str:
+    """Write ``prompt`` and read one line from stdin, like ``input()``.
+
+    Goes straight to the stdout/stdin streams, skipping the extra flushes
+    ``input()`` performs on every call; raises EOFError when stdin is
+    exhausted, as ``input()`` does.
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError("EOF when reading a line")
+    return line.rstrip("\n")
+
+
 def choose(prompt: str, options: list[str]) -> str:
     """Display a numbered menu and return the chosen option."""
     print(f"\n{prompt}")
     for i, opt in enumerate(options, 1):
         print(f"  [{i}] {opt}")
     while True:
-        raw = input("  > ").strip()
+        raw = _read_line("  > ").strip()
         if raw.isdigit() and 1 <= int(raw) <= len(options):
             choice = options[int(raw) - 1]
             print(f"  ✔ {choice}")
@@ -628,7 +775,7 @@ def choose(prompt: str, options: list[str]) -> str:
 def ask_text(prompt: str, allow_empty=False) -> str:
     """Ask for free-text input."""
     while True:
-        val = input(f"\n{prompt}: ").strip()
+        val = _read_line(f"\n{prompt}: ").strip()
         if val or allow_empty:
             return val
         print("  ✗ This field cannot be empty.")
@@ -637,7 +784,7 @@ def ask_text(prompt: str, allow_empty=False) -> str:
 def ask_yes_no(prompt: str) -> bool:
     """Ask a yes/no question."""
     while True:
-        val = input(f"\n{prompt} (y/n): ").strip().lower()
+        val = _read_line(f"\n{prompt} (y/n): ").strip().lower()
         if val in ("y", "yes", "s", "sim"):
             return True
         if val in ("n", "no", "nao", "não"):
@@ -645,20 +792,24 @@ def ask_yes_no(prompt: str) -> bool:
         print("  ✗ Please answer y or n.")
 
 
-def print_preview(docs: list[tuple], labels: dict):
+def print_preview(docs: list[tuple], labels: SimpleNamespace):
     """Print a preview of the checklist to the terminal."""
-    headers = labels["headers"]
-    print("\n" + "=" * 90)
-    print(f"  {'PREVIEW':^86}")
-    print("=" * 90)
-    print(f"  {headers[0]:<14} {headers[1]:<46} {headers[2]:<10} {headers[3]}")
-    print("-" * 90)
+    headers = labels.headers
+    row = "  {:<14} {:<46} {:<10} {}\n".format
+    lines = [
+        "\n" + "=" * 90 + "\n",
+        f"  {'PREVIEW':^86}\n",
+        "=" * 90 + "\n",
+        row(*headers[:4]),
+        "-" * 90 + "\n",
+    ]
     for cat, name, req, prio in docs:
         name_display = (name[:43] + "...") if len(name) > 46 else name
-        print(f"  {cat:<14} {name_display:<46} {req:<10} {prio}")
-    print("-" * 90)
-    print(f"  Total: {len(docs)} documents")
-    print("=" * 90)
+        lines.append(row(cat, name_display, req, prio))
+    lines.append("-" * 90 + "\n")
+    lines.append(f"  Total: {len(docs)} documents\n")
+    lines.append("=" * 90 + "\n")
+    sys.stdout.write("".join(lines))
 
 
 def ask_custom_documents(lang: str) -> list[tuple]:
@@ -686,36 +837,64 @@ def ask_custom_documents(lang: str) -> list[tuple]:
 # Main
 # ---------------------------------------------------------------------------
 
-def generate_excel(
+# Anything but Unicode alphanumerics, "_", " " and "-" (str.isalnum semantics);
+# one character at a time, so each offending character becomes one "_"
+_UNSAFE_FILENAME_CHAR = re.compile(r"[^\w \-]")
+
+
+def generate_excel_bytes(
     target: str,
     deal_type: str,
     sector: str,
     jurisdiction: str,
     lang: str,
     docs: list[tuple],
-) -> str:
-    """Generate the Excel file and return the output path."""
-    wb = Workbook()
+) -> bytes:
+    """Build the workbook and return the .xlsx file contents.
+
+    Useful when the file is served straight from memory (e.g. an HTTP
+    response) instead of being written to disk.
+    """
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
     labels = LABELS[lang]
 
     create_checklist_tab(wb, docs, lang, labels)
     create_summary_tab(wb, docs, labels, target, deal_type, sector, jurisdiction)
     create_instructions_tab(wb, labels)
 
-    safe_name = "".join(c if c.isalnum() or c in " _-" else "_" for c in target).strip()
-    safe_name = safe_name.replace(" ", "_")
+    buf = BytesIO()
+    wb.save(buf)
+    return buf.getvalue()
+
+
+def generate_excel(
+    target: str,
+    deal_type: str,
+    sector: str,
+    jurisdiction: str,
+    lang: str,
+    docs: list[tuple],
+) -> str:
+    """Generate the Excel file and return the output path."""
+    safe_name = _UNSAFE_FILENAME_CHAR.sub("_", target).strip().replace(" ", "_")
     date_str = datetime.now().strftime("%Y%m%d")
     filename = f"{safe_name}_DD_Checklist_{date_str}.xlsx"
 
-    wb.save(filename)
+    # Serialised in memory, so the filesystem sees a single write
+    data = generate_excel_bytes(target, deal_type, sector, jurisdiction, lang, docs)
+    Path(filename).write_bytes(data)
     return filename
 
 
+_RULE = "=" * 60
+_BANNER = f"\n{_RULE}\n   DUE DILIGENCE — DOCUMENT CHECKLIST GENERATOR\n{_RULE}\n"
+
+
 def run_interactive():
     """Run the interactive terminal flow."""
-    print("\n" + "=" * 60)
-    print("   DUE DILIGENCE — DOCUMENT CHECKLIST GENERATOR")
-    print("=" * 60)
+    sys.stdout.write(_BANNER)
 
     lang = choose("Language / Idioma:", ["EN — English", "PT — Português"])
     lang = "EN" if lang.startswith("EN") else "PT"
@@ -732,7 +911,7 @@ def run_interactive():
     target = ask_text("Target company name" if lang == "EN" else "Nome da empresa-alvo")
 
     # Build document list
-    docs = build_document_list(deal_type, sector, lang)
+    docs = list(build_document_list(deal_type, sector, lang))
 
     # Preview
     labels = LABELS[lang]
@@ -750,9 +929,7 @@ def run_interactive():
     if ask_yes_no("Generate Excel file?" if lang == "EN" else "Gerar ficheiro Excel?"):
         filepath = generate_excel(target, deal_type, sector, jurisdiction, lang, docs)
         abs_path = str(Path(filepath).resolve())
-        print("\n" + "=" * 60)
-        print(f"  ✔ File generated: {abs_path}")
-        print("=" * 60)
+        sys.stdout.write(f"\n{_RULE}\n  ✔ File generated: {abs_path}\n{_RULE}\n")
         return abs_path
     else:
         print("\n  Cancelled.")
@@ -777,7 +954,7 @@ def run_automated(
     if lang not in ("EN", "PT"):
         raise ValueError(f"Invalid language: {lang}. Must be EN or PT")
 
-    docs = build_document_list(deal_type, sector, lang)
+    docs = list(build_document_list(deal_type, sector, lang))
     if custom_docs:
         docs.extend(custom_docs)
 